@@ -4,28 +4,69 @@ sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from io import StringIO, BytesIO
+import numpy as np
+from io import BytesIO
 import base64
+import hashlib
 import json
-import time
-from datetime import datetime
+import pickle
+import re
+from datetime import datetime, time
+from functools import lru_cache
 import os
 
-# Import CrewAI integration
-from application.crew_integration import run_crew_analysis, format_results_for_display
+# For PDF generation; reportlab is only imported when a PDF is actually built
+@lru_cache(maxsize=1)
+def pdf_available():
+    """Check once whether reportlab is installed"""
+    try:
+        import reportlab  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
-# For PDF generation
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """Paragraph and table styles shared by every generated PDF, built once"""
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
+    from reportlab.platypus import TableStyle
     from reportlab.lib import colors
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+    
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=1  # Center alignment
+    )
+    # Markdown header levels 1, 2 and 3+ map onto these
+    header_styles = (styles['Heading1'], styles['Heading2'], styles['Heading3'])
+    stats_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    return styles, title_style, header_styles, stats_table_style
+
+# Markdown header line: leading hashes, then the header text
+_MD_HEADER = re.compile(r'^(#+)\s*(.*?)\s*$')
+
+# Above this many rows histograms are binned server-side instead of in the browser
+HISTOGRAM_PREBIN_ROWS = 100000
+HISTOGRAM_BINS = 50
+
+# On-disk checkpoints of analysis results, keyed by the uploaded data's content
+# hash and the analysis options
+RESULTS_CACHE_DIR = os.path.join(".cache", "results")
+
+# Rows per stats table block; large tables are split to keep ReportLab layout linear
+PDF_TABLE_CHUNK_ROWS = 40
 
 # Configure page
 st.set_page_config(
@@ -35,8 +76,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling with dark mode support
-st.markdown("""
+# Custom CSS for better styling with dark mode support, rendered together with
+# the header so static HTML costs a single markdown block per rerun
+_PAGE_STYLE = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -127,7 +169,7 @@ st.markdown("""
         color: #fafafa;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -135,8 +177,18 @@ def initialize_session_state():
         st.session_state.analysis_complete = False
     if 'uploaded_data' not in st.session_state:
         st.session_state.uploaded_data = None
+    if 'uploaded_file_id' not in st.session_state:
+        st.session_state.uploaded_file_id = None
+    if 'uploaded_data_hash' not in st.session_state:
+        st.session_state.uploaded_data_hash = None
+    if 'dtype_info' not in st.session_state:
+        st.session_state.dtype_info = None
     if 'analysis_results' not in st.session_state:
         st.session_state.analysis_results = None
+    if 'analysis_timestamp' not in st.session_state:
+        st.session_state.analysis_timestamp = None
+    if 'checkpoint_key' not in st.session_state:
+        st.session_state.checkpoint_key = None
     if 'crew_output' not in st.session_state:
         st.session_state.crew_output = None
     if 'gemini_api_key' not in st.session_state:
@@ -219,13 +271,13 @@ def create_sidebar():
         return uploaded_file, analysis_depth, chart_types, api_key
 
 def display_header():
-    """Display main header"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>🤖 CrewAI-Powered Business Intelligence Dashboard</h1>
-        <p>Upload your data and let our AI agents provide deep insights and automated reporting</p>
-    </div>
-    """, unsafe_allow_html=True)
+    """Display page styles and main header"""
+    st.markdown(_PAGE_STYLE + """
+<div class="main-header">
+    <h1>🤖 CrewAI-Powered Business Intelligence Dashboard</h1>
+    <p>Upload your data and let our AI agents provide deep insights and automated reporting</p>
+</div>
+""", unsafe_allow_html=True)
 
 
 def display_upload_section():
@@ -239,6 +291,133 @@ def display_upload_section():
     </div>
     """, unsafe_allow_html=True)
 
+# Uploads above these sizes use sampled dtypes / Polars for parsing
+LARGE_CSV_BYTES = 50 * 1024 * 1024
+HUGE_CSV_BYTES = 500 * 1024 * 1024
+DTYPE_SAMPLE_ROWS = 10000
+
+def _is_temporal(series):
+    """Whether pyarrow inferred a timestamp or time-of-day type for this column"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return True
+    if series.dtype != object:
+        return False
+    first = series.first_valid_index()
+    return first is not None and isinstance(series[first], time)
+
+def _read_csv_bytes(file_bytes, dtype=None):
+    """Parse CSV bytes with the pyarrow engine, falling back to the C parser"""
+    try:
+        df = pd.read_csv(BytesIO(file_bytes), engine="pyarrow", dtype=dtype)
+    except (ImportError, ValueError):
+        # pyarrow missing or unable to parse this file, use the default C parser
+        return pd.read_csv(BytesIO(file_bytes), dtype=dtype)
+    
+    # pyarrow turns times and ISO timestamps into datetime values, where the C
+    # parser keeps the original text; re-read just those columns as text
+    temporal = [col for col in df.columns if _is_temporal(df[col])]
+    if temporal:
+        text = pd.read_csv(BytesIO(file_bytes), usecols=temporal)
+        for col in temporal:
+            df[col] = text[col]
+    return df
+
+def _parse_csv(file_bytes):
+    """Parse CSV bytes, picking the parser strategy by upload size"""
+    if len(file_bytes) > HUGE_CSV_BYTES:
+        try:
+            import polars as pl
+        except ImportError:
+            pl = None
+        if pl is not None:
+            try:
+                # Polars parses multi-threaded into Arrow columns
+                return pl.read_csv(BytesIO(file_bytes), infer_schema_length=DTYPE_SAMPLE_ROWS).to_pandas()
+            except (pl.exceptions.PolarsError, ImportError, ValueError):
+                # Rows past the schema sample don't fit it, or no pyarrow to convert
+                pass
+    
+    if len(file_bytes) > LARGE_CSV_BYTES:
+        # Pin the sampled numeric dtypes so the full parse skips inferring them.
+        # Only numeric ones: a contradicting row then raises, whereas a pinned
+        # bool or string dtype would silently coerce it
+        sample_dtypes = {
+            col: dtype
+            for col, dtype in pd.read_csv(BytesIO(file_bytes), nrows=DTYPE_SAMPLE_ROWS).dtypes.items()
+            if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype)
+        }
+        try:
+            return _read_csv_bytes(file_bytes, dtype=sample_dtypes)
+        except ValueError:
+            # Rows past the sample contradict the sampled dtypes
+            pass
+    
+    return _read_csv_bytes(file_bytes)
+
+def _downcast_numeric(df):
+    """Shrink integer columns to the smallest dtype that holds their values"""
+    # Floats stay float64: float32 values print with noise in the CSV and PDF exports
+    for col in df.select_dtypes(include=['integer']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_csv(file_bytes: bytes) -> pd.DataFrame:
+    """Parse uploaded CSV bytes once per upload instead of on every rerun"""
+    return _downcast_numeric(_parse_csv(file_bytes))
+
+def _data_key(df):
+    """Content hash keying the per-upload caches; the DataFrame itself is never hashed"""
+    if df is st.session_state.get('uploaded_data') and st.session_state.get('uploaded_data_hash'):
+        return st.session_state.uploaded_data_hash
+    return _df_content_hash(df)
+
+# The cached helpers below take the upload's content hash as their key and the
+# DataFrame as an underscore argument, so Streamlit never pickles the frame
+@st.cache_data(show_spinner=False, max_entries=8)
+def _column_profile(data_hash, _df):
+    """Single scan of dtypes and per-column null counts shared by validation and preview"""
+    dtypes = _df.dtypes
+    numeric_mask = dtypes.apply(
+        lambda t: pd.api.types.is_numeric_dtype(t) and not pd.api.types.is_bool_dtype(t)
+    )
+    # Text is object dtype on older pandas and str (StringDtype) on pandas 3
+    categorical_mask = dtypes.apply(
+        lambda t: pd.api.types.is_object_dtype(t) or pd.api.types.is_string_dtype(t)
+    )
+    return {
+        'dtypes': dtypes,
+        'nulls': _df.isnull().sum(),
+        'numeric_cols': dtypes.index[numeric_mask.to_numpy(dtype=bool)],
+        'categorical_cols': dtypes.index[categorical_mask.to_numpy(dtype=bool)]
+    }
+
+def classify_columns(df):
+    """Numeric and categorical column names, classified once per upload"""
+    profile = _column_profile(_data_key(df), df)
+    return {
+        'numeric': profile['numeric_cols'].tolist(),
+        'categorical': profile['categorical_cols'].tolist()
+    }
+
+def _numeric_cols(df):
+    """Numeric columns of the DataFrame"""
+    return _column_profile(_data_key(df), df)['numeric_cols']
+
+def _missing_total(df):
+    """Total number of missing cells, reduced from the cached per-column counts"""
+    return int(np.sum(_column_profile(_data_key(df), df)['nulls'].to_numpy()))
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _describe(data_hash, _df):
+    """Summary statistics for the numeric columns"""
+    return _df[_column_profile(data_hash, _df)['numeric_cols']].describe()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _corr(data_hash, _df):
+    """Correlation matrix for the numeric columns"""
+    return _df[_column_profile(data_hash, _df)['numeric_cols']].corr()
+
 def validate_csv_data(df):
     """Validate uploaded CSV data"""
     issues = []
@@ -250,14 +429,19 @@ def validate_csv_data(df):
         issues.append("CSV should have at least 2 columns")
     
     # Check for numeric columns
-    numeric_cols = df.select_dtypes(include=['number']).columns
+    numeric_cols = _numeric_cols(df)
     if len(numeric_cols) == 0:
         issues.append("No numeric columns found for analysis")
     
     return issues
 
-def display_data_preview(df):
+def display_data_preview(df, numeric_cols=None):
     """Display data preview and basic statistics"""
+    profile = _column_profile(_data_key(df), df)
+    if numeric_cols is None:
+        numeric_cols = profile['numeric_cols']
+    dtypes, nulls, n = profile['dtypes'], profile['nulls'], len(df)
+    
     st.markdown("### 📋 Data Preview")
     
     col1, col2, col3, col4 = st.columns(4)
@@ -267,10 +451,9 @@ def display_data_preview(df):
     with col2:
         st.metric("Total Columns", len(df.columns))
     with col3:
-        numeric_cols = len(df.select_dtypes(include=['number']).columns)
-        st.metric("Numeric Columns", numeric_cols)
+        st.metric("Numeric Columns", len(numeric_cols))
     with col4:
-        missing_data = df.isnull().sum().sum()
+        missing_data = _missing_total(df)
         st.metric("Missing Values", missing_data)
     
     # Data preview
@@ -279,16 +462,109 @@ def display_data_preview(df):
     
     # Column information
     st.markdown("#### Column Information:")
+    null_counts = nulls.to_numpy()
     col_info = pd.DataFrame({
-        'Column': df.columns,
-        'Type': df.dtypes,
-        'Non-Null Count': df.count(),
-        'Missing %': ((df.isnull().sum() / len(df)) * 100).round(2)
+        'Column': df.columns.to_numpy(),
+        'Type': dtypes.astype(str).to_numpy(),
+        'Non-Null Count': n - null_counts,
+        'Missing %': np.round(null_counts * (100.0 / n), 2)
     })
     st.dataframe(col_info, use_container_width=True)
 
+def _df_content_hash(df):
+    """Stable content hash of a DataFrame, including its column names"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+def _figure_json(fig):
+    """Plotly JSON for a chart, which may already be serialized"""
+    return fig if isinstance(fig, str) else fig.to_json()
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _figure_from_json(fig_json):
+    """Plotly figure rebuilt from its JSON once, instead of re-validated on every rerun"""
+    import plotly.io as pio
+    return pio.from_json(fig_json)
+
+def _checkpoint_key(df_hash, analysis_depth, chart_types):
+    """Checkpoint name for one analysis: the data hash plus a hash of its options"""
+    options = json.dumps([analysis_depth, list(chart_types)])
+    return f"{df_hash}-{hashlib.blake2b(options.encode('utf-8'), digest_size=8).hexdigest()}"
+
+def save_results_checkpoint(checkpoint_key, results):
+    """Persist analysis results so a page refresh can re-hydrate them without re-running"""
+    payload = dict(results)
+    # Figures are stored as plotly JSON, which is smaller and portable across versions
+    payload['visualizations'] = {
+        name: _figure_json(fig) for name, fig in results.get('visualizations', {}).items()
+    }
+    path = os.path.join(RESULTS_CACHE_DIR, f"{checkpoint_key}.pkl")
+    stats_path = os.path.join(RESULTS_CACHE_DIR, f"{checkpoint_key}.stats.parquet")
+    try:
+        os.makedirs(RESULTS_CACHE_DIR, exist_ok=True)
+        
+        # The stats table goes to Parquet, which loads faster and is smaller than pickle
+        stats_df = payload.get('summary_stats')
+        if isinstance(stats_df, pd.DataFrame):
+            try:
+                stats_df.to_parquet(stats_path, engine='pyarrow', compression='zstd')
+            except (ImportError, ValueError, NotImplementedError):
+                # pyarrow missing or unsupported column types, keep it in the pickle
+                pass
+            else:
+                payload['summary_stats'] = None
+                payload['summary_stats_parquet'] = True
+        
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        print(f"Error saving results checkpoint: {str(e)}")
+
+def load_results_checkpoint(checkpoint_key):
+    """Load previously checkpointed analysis results, or None if there are none"""
+    path = os.path.join(RESULTS_CACHE_DIR, f"{checkpoint_key}.pkl")
+    if not os.path.exists(path):
+        return None
+    
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+        if payload.pop('summary_stats_parquet', False):
+            payload['summary_stats'] = pd.read_parquet(
+                os.path.join(RESULTS_CACHE_DIR, f"{checkpoint_key}.stats.parquet")
+            )
+        return payload
+    except Exception as e:
+        print(f"Error loading results checkpoint: {str(e)}")
+        return None
+
+# In memory only: Streamlit ignores ttl for disk-persisted caches, and the
+# results checkpoint already keeps finished analyses across restarts
+@st.cache_data(show_spinner=False, ttl=24 * 3600, max_entries=8)
+def _cached_crew(df_bytes_hash: str, depth: str, charts: tuple, key_hash: str, _df, _api_key):
+    """Run the CrewAI analysis once per (data, depth, charts, API key) combination"""
+    from application.crew_integration import run_crew_analysis
+    
+    analysis_options = {
+        'analysis_depth': depth,
+        'chart_types': list(charts),
+        'api_key': _api_key
+    }
+    # The progress tracker is created in here rather than passed in, so cache
+    # hits replay it instead of touching elements from an earlier run
+    results = run_crew_analysis(_df, analysis_options)
+    if not results:
+        # Raising keeps failed runs out of the cache
+        raise RuntimeError("CrewAI analysis returned no results")
+    return results
+
 def run_crew_analysis_with_ui(df, analysis_depth="Basic", chart_types=None, api_key=None):
     """Run CrewAI analysis with proper UI integration"""
+    from application.crew_integration import format_results_for_display
+    
     if chart_types is None:
         chart_types = ["Line Charts", "Bar Charts"]
     
@@ -298,65 +574,60 @@ def run_crew_analysis_with_ui(df, analysis_depth="Basic", chart_types=None, api_
         st.info("Please enter your API key in the sidebar to proceed.")
         return None
     
-    analysis_options = {
-        'analysis_depth': analysis_depth,
-        'chart_types': chart_types,
-        'api_key': api_key
-    }
-    
     # Create progress container
     progress_container = st.container()
     
     with progress_container:
         st.markdown("### 🔄 AI Analysis in Progress")
         
-        # Show progress steps
-        progress_steps = [
-            "🔑 Validating API credentials...",
-            "📊 Analyzing data structure...",
-            "🤖 Running AI analysis...",
-            "📈 Generating insights...",
-            "📋 Preparing report..."
-        ]
-        
-        progress_bar = st.progress(0)
         status_text = st.empty()
-        
-        for i, step in enumerate(progress_steps):
-            status_text.text(step)
-            progress_bar.progress((i + 1) / len(progress_steps))
-            time.sleep(0.5)  # Simulate processing time
+        status_text.text("🤖 Running AI analysis...")
+        dtype_info = st.session_state.get('dtype_info') or classify_columns(df)
         
         try:
-            # Run the actual CrewAI analysis with API key
-            results = run_crew_analysis(df, analysis_options)
+            # Run the actual CrewAI analysis with API key, reusing cached results
+            # for identical data and options. The key is hashed, never cached as plaintext.
+            key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
+            df_hash = st.session_state.get('uploaded_data_hash') or _df_content_hash(df)
+            results = _cached_crew(
+                df_hash, analysis_depth, tuple(chart_types), key_hash, df, api_key
+            )
             
             if results:
                 # Format results for display
                 formatted_results = format_results_for_display(results)
+                # Stored with the results so a re-hydrated checkpoint keeps its original date
+                formatted_results['generated_at'] = datetime.now()
+                # Only real crew results are checkpointed, never the fallback
+                save_results_checkpoint(
+                    _checkpoint_key(df_hash, analysis_depth, chart_types), formatted_results
+                )
                 status_text.text("✅ Analysis completed successfully!")
                 return formatted_results
             else:
                 # Fallback to sample analysis if CrewAI fails
                 st.warning("CrewAI analysis with Gemini API unavailable. Generating sample analysis...")
                 status_text.text("⚠️ Using fallback analysis...")
-                return generate_fallback_analysis(df)
+                return generate_fallback_analysis(_data_key(df), df, dtype_info['numeric'], dtype_info['categorical'])
                 
         except Exception as e:
             st.warning(f"Gemini API analysis failed: {str(e)}. Generating sample analysis...")
             status_text.text("⚠️ Using fallback analysis...")
-            return generate_fallback_analysis(df)
+            return generate_fallback_analysis(_data_key(df), df, dtype_info['numeric'], dtype_info['categorical'])
 
-def generate_fallback_analysis(df):
+@st.cache_data(show_spinner=False, max_entries=4)
+def generate_fallback_analysis(data_hash, _df, numeric_cols=None, categorical_cols=None):
     """Generate fallback analysis when CrewAI is not available"""
-    numeric_cols = df.select_dtypes(include=['number']).columns
-    categorical_cols = df.select_dtypes(include=['object']).columns
+    if numeric_cols is None or categorical_cols is None:
+        dtype_info = classify_columns(_df)
+        numeric_cols, categorical_cols = dtype_info['numeric'], dtype_info['categorical']
+    missing_total = _missing_total(_df)
     
     # Generate basic insights
     insights = [
-        f"Dataset contains {len(df):,} records across {len(df.columns)} columns",
+        f"Dataset contains {len(_df):,} records across {len(_df.columns)} columns",
         f"Found {len(numeric_cols)} numeric and {len(categorical_cols)} categorical columns",
-        f"Data completeness: {((1 - df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100):.1f}%"
+        f"Data completeness: {((1 - missing_total / (len(_df) * len(_df.columns))) * 100):.1f}%"
     ]
     
     if len(numeric_cols) > 0:
@@ -369,27 +640,27 @@ def generate_fallback_analysis(df):
         "Focus analysis on key performance indicators"
     ]
     
-    if df.isnull().sum().sum() > 0:
+    if missing_total > 0:
         recommendations.append("Address missing data through imputation or collection improvements")
     
     # Generate summary statistics
     if len(numeric_cols) > 0:
-        summary_stats = df[numeric_cols].describe()
+        summary_stats = _describe(data_hash, _df)
     else:
         # Create a basic summary for non-numeric data
         summary_stats = pd.DataFrame({
-            'Total Records': [len(df)],
-            'Total Columns': [len(df.columns)],
-            'Missing Values': [df.isnull().sum().sum()],
+            'Total Records': [len(_df)],
+            'Total Columns': [len(_df.columns)],
+            'Missing Values': [missing_total],
             'Numeric Columns': [len(numeric_cols)],
             'Categorical Columns': [len(categorical_cols)]
         })
     
     # Generate visualizations
-    visualizations = generate_sample_charts(df)
+    visualizations = generate_sample_charts(data_hash, _df, numeric_cols)
     
     # Generate report
-    report = generate_sample_report(df)
+    report = generate_sample_report(data_hash, _df, numeric_cols, categorical_cols)
     
     return {
         'insights': insights,
@@ -399,59 +670,85 @@ def generate_fallback_analysis(df):
         'report': report
     }
 
-def generate_sample_charts(df):
+@st.cache_data(show_spinner=False, max_entries=4)
+def generate_sample_charts(data_hash, _df, numeric_cols=None):
     """Generate sample charts from the data"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
     charts = {}
-    numeric_cols = df.select_dtypes(include=['number']).columns
+    if numeric_cols is None:
+        numeric_cols = _numeric_cols(_df)
     
     if len(numeric_cols) >= 2:
         # Correlation heatmap
-        corr_matrix = df[numeric_cols].corr()
+        corr_matrix = _corr(data_hash, _df)
         charts['correlation'] = px.imshow(
             corr_matrix,
             title="Correlation Matrix",
-            color_continuous_scale="RdBu"
+            color_continuous_scale="RdBu",
+            zmin=-1,
+            zmax=1
         )
         
         # Distribution plot
-        charts['distribution'] = px.histogram(
-            df, 
-            x=numeric_cols[0],
-            title=f"Distribution of {numeric_cols[0]}"
-        )
+        if len(_df) > HISTOGRAM_PREBIN_ROWS:
+            # Send bin counts to the browser rather than every row
+            values = _df[numeric_cols[0]].dropna().to_numpy()
+            counts, edges = np.histogram(values, bins=HISTOGRAM_BINS)
+            charts['distribution'] = go.Figure(
+                go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)),
+                layout=dict(
+                    title=f"Distribution of {numeric_cols[0]}",
+                    xaxis_title=str(numeric_cols[0]),
+                    yaxis_title="count",
+                    bargap=0
+                )
+            )
+        else:
+            charts['distribution'] = px.histogram(
+                _df, 
+                x=numeric_cols[0],
+                title=f"Distribution of {numeric_cols[0]}"
+            )
         
         # Scatter plot if multiple numeric columns
         if len(numeric_cols) >= 2:
             charts['scatter'] = px.scatter(
-                df,
+                _df,
                 x=numeric_cols[0],
                 y=numeric_cols[1],
-                title=f"{numeric_cols[0]} vs {numeric_cols[1]}"
+                title=f"{numeric_cols[0]} vs {numeric_cols[1]}",
+                render_mode='webgl'
             )
     
-    return charts
+    # Cached as plotly JSON, which is cheaper to copy out of the cache than figures
+    return {name: fig.to_json() for name, fig in charts.items()}
 
-def generate_sample_report(df):
+@st.cache_data(show_spinner=False, max_entries=4)
+def generate_sample_report(data_hash, _df, numeric_cols=None, categorical_cols=None):
     """Generate a sample report"""
-    numeric_cols = df.select_dtypes(include=['number']).columns
-    categorical_cols = df.select_dtypes(include=['object']).columns
+    if numeric_cols is None or categorical_cols is None:
+        dtype_info = classify_columns(_df)
+        numeric_cols, categorical_cols = dtype_info['numeric'], dtype_info['categorical']
+    missing_total = _missing_total(_df)
     
     report = f"""
 # Data Analysis Report
 
 ## Executive Summary
-This report provides a comprehensive analysis of the uploaded dataset containing {len(df)} records and {len(df.columns)} columns.
+This report provides a comprehensive analysis of the uploaded dataset containing {len(_df)} records and {len(_df.columns)} columns.
 
 ## Data Overview
-- **Total Records**: {len(df):,}
+- **Total Records**: {len(_df):,}
 - **Numeric Columns**: {len(numeric_cols)}
 - **Categorical Columns**: {len(categorical_cols)}
-- **Missing Data**: {df.isnull().sum().sum()} values
+- **Missing Data**: {missing_total} values
 
 ## Key Findings
-1. **Data Quality**: The dataset shows {'good' if df.isnull().sum().sum() < len(df) * 0.1 else 'moderate'} data quality
+1. **Data Quality**: The dataset shows {'good' if missing_total < len(_df) * 0.1 else 'moderate'} data quality
 2. **Distribution**: Data shows {'normal' if len(numeric_cols) > 0 else 'non-numeric'} distribution patterns
-3. **Completeness**: {((1 - df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100):.1f}% data completeness
+3. **Completeness**: {((1 - missing_total / (len(_df) * len(_df.columns))) * 100):.1f}% data completeness
 
 ## Recommendations
 - Regular data quality monitoring
@@ -460,30 +757,26 @@ This report provides a comprehensive analysis of the uploaded dataset containing
 """
     return report
 
-def generate_pdf_report(results):
+def generate_pdf_report(results, generated_at=None):
     """Generate PDF report from analysis results"""
-    if not PDF_AVAILABLE:
+    if not pdf_available():
         return None
     
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak
+    
     try:
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
-        styles = getSampleStyleSheet()
+        styles, title_style, header_styles, stats_table_style = _pdf_styles()
         story = []
         
         # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
         story.append(Paragraph("Crew-AI Powered Data Analysis Report", title_style))
         story.append(Spacer(1, 20))
         
         # Timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = (generated_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         story.append(Paragraph(f"Generated on: {timestamp}", styles['Normal']))
         story.append(Spacer(1, 20))
         
@@ -504,24 +797,25 @@ def generate_pdf_report(results):
                 # Check if DataFrame has data
                 if not stats_df.empty and len(stats_df.columns) > 0:
                     # Convert DataFrame to table format
-                    stats_data = [stats_df.columns.tolist()]
-                    for _, row in stats_df.iterrows():
-                        stats_data.append([str(val) for val in row.tolist()])
+                    stats_data = [stats_df.columns.tolist()] + stats_df.astype(str).to_numpy().tolist()
                     
                     # Only create table if we have both headers and data
                     if len(stats_data) > 1 and len(stats_data[0]) > 0:
-                        table = Table(stats_data)
-                        table.setStyle(TableStyle([
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 12),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ]))
-                        story.append(table)
+                        header, rows = stats_data[0], stats_data[1:]
+                        # Fixed column widths, proportional to the headers, so
+                        # ReportLab doesn't measure every cell
+                        header_lens = [max(len(str(h)), 6) for h in header]
+                        col_widths = [doc.width * l / sum(header_lens) for l in header_lens]
+                        for start in range(0, len(rows), PDF_TABLE_CHUNK_ROWS):
+                            if start:
+                                story.append(PageBreak())
+                            table = Table(
+                                [header] + rows[start:start + PDF_TABLE_CHUNK_ROWS],
+                                colWidths=col_widths,
+                                repeatRows=1
+                            )
+                            table.setStyle(stats_table_style)
+                            story.append(table)
                     else:
                         story.append(Paragraph("No statistical data available.", styles['Normal']))
                 else:
@@ -546,20 +840,16 @@ def generate_pdf_report(results):
             story.append(Paragraph("Detailed Analysis", styles['Heading2']))
             # Split report into paragraphs
             report_lines = results['report'].split('\n')
+            normal = styles['Normal']
             for line in report_lines:
                 if line.strip():
-                    if line.startswith('#'):
+                    header = _MD_HEADER.match(line)
+                    if header:
                         # Handle markdown headers
-                        level = len(line) - len(line.lstrip('#'))
-                        text = line.lstrip('# ').strip()
-                        if level == 1:
-                            story.append(Paragraph(text, styles['Heading1']))
-                        elif level == 2:
-                            story.append(Paragraph(text, styles['Heading2']))
-                        else:
-                            story.append(Paragraph(text, styles['Heading3']))
+                        level = len(header.group(1))
+                        story.append(Paragraph(header.group(2), header_styles[min(level, 3) - 1]))
                     else:
-                        story.append(Paragraph(line, styles['Normal']))
+                        story.append(Paragraph(line, normal))
                     story.append(Spacer(1, 6))
         else:
             story.append(Paragraph("Detailed Analysis", styles['Heading2']))
@@ -574,6 +864,37 @@ def generate_pdf_report(results):
         print(f"Error generating PDF: {str(e)}")
         return None
 
+def _results_key(results, generated_at):
+    """Cache key for the exports of one analysis: its text, stats table contents and timestamp"""
+    stats_df = results.get('summary_stats')
+    stats_sig = None if stats_df is None else _df_content_hash(stats_df)
+    payload = json.dumps(
+        [results.get('insights'), results.get('recommendations'), results.get('report'),
+         stats_sig, generated_at.isoformat()],
+        default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _cached_pdf(results_key, generated_at, _results):
+    """PDF bytes for a given set of results, built at most once"""
+    return generate_pdf_report(_results, generated_at)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _cached_stats_csv(results_key, _stats_df):
+    """CSV export of the summary statistics as UTF-8 bytes, built at most once"""
+    return _stats_df.to_csv().encode('utf-8')
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _cached_insights_json(results_key, generated_at, _results):
+    """JSON export of insights and recommendations, built at most once"""
+    insights_data = {
+        'insights': _results['insights'],
+        'recommendations': _results['recommendations'],
+        'timestamp': generated_at.isoformat()
+    }
+    return json.dumps(insights_data, indent=2).encode('utf-8')
+
 def display_results(results):
     """Display analysis results"""
     st.markdown("## 📊 Analysis Results")
@@ -590,7 +911,7 @@ def display_results(results):
         st.markdown("### 📈 Visualizations")
         
         for chart_name, chart in results['visualizations'].items():
-            st.plotly_chart(chart, use_container_width=True)
+            st.plotly_chart(_figure_from_json(_figure_json(chart)), use_container_width=True)
     
     # Summary Statistics
     st.markdown("### 📋 Summary Statistics")
@@ -604,6 +925,10 @@ def display_results(results):
 def create_download_section(results):
     """Create download section for reports"""
     st.markdown("### 📥 Download Reports")
+    # One timestamp per analysis keeps file names stable across reruns
+    generated_at = st.session_state.analysis_timestamp or datetime.now()
+    results_key = _results_key(results, generated_at)
+    ts = generated_at.strftime('%Y%m%d_%H%M%S')
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -612,47 +937,40 @@ def create_download_section(results):
         if st.download_button(
             label="📄 Download Report (TXT)",
             data=results['report'],
-            file_name=f"analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            file_name=f"analysis_report_{ts}.txt",
             mime="text/plain"
         ):
             st.success("Report downloaded!")
     
     with col2:
         # Download summary statistics as CSV
-        csv_buffer = StringIO()
-        results['summary_stats'].to_csv(csv_buffer)
         if st.download_button(
             label="📊 Download Stats (CSV)",
-            data=csv_buffer.getvalue(),
-            file_name=f"summary_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            data=_cached_stats_csv(results_key, results['summary_stats']),
+            file_name=f"summary_stats_{ts}.csv",
             mime="text/csv"
         ):
             st.success("Statistics downloaded!")
     
     with col3:
         # Download insights as JSON
-        insights_data = {
-            'insights': results['insights'],
-            'recommendations': results['recommendations'],
-            'timestamp': datetime.now().isoformat()
-        }
         if st.download_button(
             label="💡 Download Insights (JSON)",
-            data=json.dumps(insights_data, indent=2),
-            file_name=f"insights_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            data=_cached_insights_json(results_key, generated_at, results),
+            file_name=f"insights_{ts}.json",
             mime="application/json"
         ):
             st.success("Insights downloaded!")
     
     with col4:
         # Download PDF report
-        if PDF_AVAILABLE:
-            pdf_data = generate_pdf_report(results)
+        if pdf_available():
+            pdf_data = _cached_pdf(results_key, generated_at, results)
             if pdf_data:
                 if st.download_button(
                     label="📑 Download PDF Report",
                     data=pdf_data,
-                    file_name=f"analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                    file_name=f"analysis_report_{ts}.pdf",
                     mime="application/pdf"
                 ):
                     st.success("PDF Report downloaded!")
@@ -671,8 +989,24 @@ def main():
     
     if uploaded_file is not None:
         try:
-            # Read and validate data
-            df = pd.read_csv(uploaded_file)
+            # Read and validate data once per upload; the helper caches are
+            # keyed on the content hash stored alongside it
+            if st.session_state.uploaded_file_id != uploaded_file.file_id:
+                st.session_state.uploaded_data = load_csv(uploaded_file.getvalue())
+                st.session_state.uploaded_file_id = uploaded_file.file_id
+                st.session_state.uploaded_data_hash = _df_content_hash(st.session_state.uploaded_data)
+                st.session_state.dtype_info = classify_columns(st.session_state.uploaded_data)
+            
+            # Re-hydrate results from an earlier analysis of the same data and
+            # options, whenever either changes
+            checkpoint_key = _checkpoint_key(st.session_state.uploaded_data_hash, analysis_depth, chart_types)
+            if st.session_state.checkpoint_key != checkpoint_key:
+                st.session_state.checkpoint_key = checkpoint_key
+                checkpoint = load_results_checkpoint(checkpoint_key)
+                st.session_state.analysis_results = checkpoint
+                st.session_state.analysis_complete = checkpoint is not None
+                st.session_state.analysis_timestamp = checkpoint.get('generated_at') if checkpoint else None
+            df = st.session_state.uploaded_data
             issues = validate_csv_data(df)
             
             if issues:
@@ -681,10 +1015,8 @@ def main():
                     st.error(f"• {issue}")
                 return
             
-            st.session_state.uploaded_data = df
-            
             # Display data preview
-            display_data_preview(df)
+            display_data_preview(df, st.session_state.dtype_info['numeric'])
             
             # Analysis button with API key check
             analysis_button_disabled = not api_key or len(api_key) <= 20
@@ -704,6 +1036,7 @@ def main():
                     if results:
                         st.session_state.analysis_results = results
                         st.session_state.analysis_complete = True
+                        st.session_state.analysis_timestamp = results.get('generated_at') or datetime.now()
                         st.success("Analysis completed successfully!")
                         st.rerun()
             
@@ -734,8 +1067,8 @@ def main():
             """)
     
     # Footer
-    st.markdown("---")
     st.markdown("""
+    <hr>
     <style>
     body[data-theme="light"] .custom-footer {
         color: #666;
@@ -5,7 +5,16 @@ This module handles the integration between Streamlit UI and CrewAI agents
 from directory.data_analyst import DataAnalystAgent
 from directory.insight_agent import InsightAgent
 from directory.report_writer import ReportWriterAgent
+from directory.tools._kernels import (
+    column_moments, column_outlier_counts, column_quantiles, top_value_counts
+)
 from crewai import Crew, Task
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -13,52 +22,76 @@ from datetime import datetime
 import json
 import io
 import base64
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import streamlit as st
 
+@st.cache_resource(show_spinner=False)
+def _build_crew():
+    """Construct the CrewAI agents, their tasks and the crew"""
+    agents = {
+        'data_analyst': DataAnalystAgent(),
+        'insight_agent': InsightAgent(),
+        'report_writer': ReportWriterAgent()
+    }
+    
+    # Create tasks
+    tasks = [
+        Task(
+            description="Analyze the uploaded CSV data and provide statistical insights",
+            agent=agents['data_analyst']
+        ),
+        Task(
+            description="Generate business insights from the data analysis",
+            agent=agents['insight_agent']
+        ),
+        Task(
+            description="Create a comprehensive report with findings and recommendations",
+            agent=agents['report_writer']
+        )
+    ]
+    
+    # Create crew
+    crew = Crew(
+        agents=list(agents.values()),
+        tasks=tasks,
+        verbose=True
+    )
+    return agents, crew
+
 class CrewAIIntegration:
     """
     Main class for integrating CrewAI with Streamlit dashboard
     """
     
+    # Per-DataFrame results shared by all instances, since a new integration
+    # is created for every analysis run
+    RESULT_CACHE_SIZE = 16
+    # Above this many rows the statistics run on float32 to halve memory traffic
+    FLOAT32_MIN_ROWS = 10_000
+    # Points plotted on the trend line, sampled evenly across the whole frame
+    TREND_LINE_POINTS = 1000
+    # Rows sampled to estimate the deep memory usage of larger frames
+    MEMORY_SAMPLE_ROWS = 5000
+    _result_cache = OrderedDict()
+    _result_cache_lock = threading.Lock()
+    
     def __init__(self):
         self.crew = None
         self.agents = {}
         self.current_analysis = None
         self.progress_callback = None
+        self._progress_lock = threading.Lock()
+        self._corr_lock = threading.Lock()
+        self._corr_cache = None
     
     def initialize_crew(self):
         """Initialize CrewAI agents and crew"""
         try:
             
-            # Example agent initialization (uncomment and modify based on your setup)
-            
-            self.agents['data_analyst'] = DataAnalystAgent()
-            self.agents['insight_agent'] = InsightAgent()
-            self.agents['report_writer'] = ReportWriterAgent()
-            
-            # Create tasks
-            tasks = [
-                Task(
-                    description="Analyze the uploaded CSV data and provide statistical insights",
-                    agent=self.agents['data_analyst']
-                ),
-                Task(
-                    description="Generate business insights from the data analysis",
-                    agent=self.agents['insight_agent']
-                ),
-                Task(
-                    description="Create a comprehensive report with findings and recommendations",
-                    agent=self.agents['report_writer']
-                )
-            ]
-            
-            # Create crew
-            self.crew = Crew(
-                agents=list(self.agents.values()),
-                tasks=tasks,
-                verbose=True
-            )
+            # Agents and crew are built once per process and shared by every
+            # integration instance, rather than rebuilt on each analysis run
+            agents, self.crew = _build_crew()
+            self.agents = dict(agents)
             
             
             # For now, we'll use a mock setup
@@ -79,6 +112,30 @@ class CrewAIIntegration:
         }
         self.crew = MockCrew(self.agents)
     
+    @staticmethod
+    def dataframe_fingerprint(df: pd.DataFrame) -> str:
+        """Content hash of a DataFrame: every value and index label, plus column names and dtypes"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        digest.update("\x1f".join(f"{col}:{dtype}" for col, dtype in df.dtypes.items()).encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _memoized(self, name: str, fingerprint: str, df: pd.DataFrame, compute: Callable, *args):
+        """Return compute(df, *args), reusing the result for a DataFrame with the same content hash and args"""
+        key = (name, fingerprint, args)
+        with self._result_cache_lock:
+            if key in self._result_cache:
+                self._result_cache.move_to_end(key)
+                return self._result_cache[key]
+        
+        result = compute(df, *args)
+        
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+    
     def set_progress_callback(self, callback):
         """Set callback function for progress updates"""
         self.progress_callback = callback
@@ -86,7 +143,8 @@ class CrewAIIntegration:
     def update_progress(self, message: str, progress: int):
         """Update progress if callback is set"""
         if self.progress_callback:
-            self.progress_callback(message, progress)
+            with self._progress_lock:
+                self.progress_callback(message, progress)
     
     def analyze_csv_data(self, df: pd.DataFrame, analysis_options: Dict) -> Dict[str, Any]:
         """
@@ -104,30 +162,54 @@ class CrewAIIntegration:
                 if not self.initialize_crew():
                     raise Exception("Failed to initialize CrewAI")
             
-            # Prepare data summary for agents
-            data_summary = self.prepare_data_summary(df)
-            
-            # Update progress
-            self.update_progress("🔍 Data Analyst Agent: Analyzing data structure...", 20)
-            
-            # Run data analysis
-            statistical_analysis = self.run_statistical_analysis(df)
-            
-            self.update_progress("💡 Insight Agent: Generating business insights...", 50)
-            
-            # Generate business insights
-            business_insights = self.generate_business_insights(df, statistical_analysis)
-            
-            self.update_progress("📊 Creating visualizations...", 70)
-            
-            # Create visualizations
-            visualizations = self.create_visualizations(df, analysis_options)
+            # Data summary, statistics and visualizations only depend on df,
+            # so run them concurrently. Progress is reported from this thread
+            # because Streamlit elements can't be updated from worker threads.
+            # Repeat runs on the same data reuse the memoized results.
+            chart_types = tuple(analysis_options.get('chart_types', ['Line Charts', 'Bar Charts']))
+            # Column dtypes are scanned once here and shared by every helper
+            column_types = self.classify_columns(df)
+            # Memo keys hash the whole frame, so results never outlive the data they describe
+            fingerprint = self.dataframe_fingerprint(df)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                stats_future = executor.submit(
+                    self._memoized, 'statistical_analysis', fingerprint, df,
+                    lambda d: self.run_statistical_analysis(d, column_types)
+                )
+                viz_future = executor.submit(
+                    self._memoized, 'visualizations', fingerprint, df,
+                    lambda d, charts: self.create_visualizations(d, {'chart_types': list(charts)}, column_types),
+                    chart_types
+                )
+                summary_future = executor.submit(
+                    self._memoized, 'data_summary', fingerprint, df,
+                    lambda d: self.prepare_data_summary(d, column_types)
+                )
+                
+                # Update progress
+                self.update_progress("🔍 Data Analyst Agent: Analyzing data structure...", 20)
+                
+                # Business insights need the statistics and the missing-value
+                # totals from the summary, so wait on those branches first
+                statistical_analysis = stats_future.result()
+                data_summary = summary_future.result()
+                
+                self.update_progress("💡 Insight Agent: Generating business insights...", 50)
+                
+                # Generate business insights
+                business_insights = self.generate_business_insights(
+                    df, statistical_analysis, data_summary
+                )
+                
+                self.update_progress("📊 Creating visualizations...", 70)
+                
+                visualizations = viz_future.result()
             
             self.update_progress("📝 Report Writer Agent: Compiling final report...", 90)
             
             # Generate final report
             final_report = self.generate_final_report(
-                df, statistical_analysis, business_insights, analysis_options
+                df, statistical_analysis, business_insights, analysis_options, data_summary, column_types
             )
             
             self.update_progress("✅ Analysis complete!", 100)
@@ -139,7 +221,9 @@ class CrewAIIntegration:
                 'business_insights': business_insights,
                 'visualizations': visualizations,
                 'final_report': final_report,
-                'recommendations': self.generate_recommendations(df, business_insights),
+                'recommendations': self.generate_recommendations(
+                    df, business_insights, data_summary, column_types
+                ),
                 'metadata': {
                     'analysis_date': datetime.now().isoformat(),
                     'data_shape': df.shape,
@@ -154,26 +238,109 @@ class CrewAIIntegration:
             st.error(f"Error during analysis: {str(e)}")
             return None
     
-    def prepare_data_summary(self, df: pd.DataFrame) -> Dict:
+    @staticmethod
+    def classify_columns(df: pd.DataFrame) -> Dict[str, List]:
+        """Column names by dtype family, computed once per analysis and passed to the helpers"""
+        return {
+            'numeric': df.select_dtypes(include=['number']).columns.tolist(),
+            'object': df.select_dtypes(include=['object']).columns.tolist(),
+            'categorical': df.select_dtypes(include=['object', 'category']).columns.tolist(),
+            'datetime': df.select_dtypes(include=['datetime']).columns.tolist()
+        }
+    
+    def prepare_data_summary(self, df: pd.DataFrame, column_types: Optional[Dict] = None) -> Dict:
         """Prepare data summary for agents"""
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        datetime_cols = df.select_dtypes(include=['datetime']).columns.tolist()
+        column_types = column_types or self.classify_columns(df)
+        # Scanned once here; insights, report and recommendations reuse the totals
+        null_per_col = pd.Series(self.null_counts(df), index=df.columns)
         
         return {
             'total_rows': len(df),
             'total_columns': len(df.columns),
-            'numeric_columns': numeric_cols,
-            'categorical_columns': categorical_cols,
-            'datetime_columns': datetime_cols,
-            'missing_values': df.isnull().sum().to_dict(),
+            'numeric_columns': column_types['numeric'],
+            'categorical_columns': column_types['categorical'],
+            'datetime_columns': column_types['datetime'],
+            'missing_values': null_per_col.to_dict(),
+            'total_missing': int(null_per_col.sum()),
+            'total_cells': df.size,
             'data_types': df.dtypes.astype(str).to_dict(),
-            'memory_usage': df.memory_usage(deep=True).sum()
+            'memory_usage': self.estimate_memory_usage(df)
         }
     
-    def run_statistical_analysis(self, df: pd.DataFrame) -> Dict:
+    @staticmethod
+    def null_counts(df: pd.DataFrame) -> np.ndarray:
+        """
+        Missing values per column, in column order
+        
+        NumPy integer and bool columns can't hold missing values and are
+        skipped, NumPy float columns are checked with one np.isnan pass, and
+        the rest go through isna(), which reads the validity bitmap for
+        Arrow-backed columns.
+        """
+        dtypes = df.dtypes.tolist()
+        counts = np.zeros(len(dtypes), dtype=np.int64)
+        float_pos = [
+            i for i, dtype in enumerate(dtypes)
+            if isinstance(dtype, np.dtype) and dtype.kind in 'fc'
+        ]
+        if float_pos:
+            counts[float_pos] = np.isnan(df.iloc[:, float_pos].to_numpy()).sum(axis=0)
+        for i, dtype in enumerate(dtypes):
+            if not (isinstance(dtype, np.dtype) and dtype.kind in 'iubfc'):
+                counts[i] = df.iloc[:, i].isna().sum()
+        return counts
+    
+    def estimate_memory_usage(self, df: pd.DataFrame) -> int:
+        """
+        Deep memory usage in bytes, extrapolated from a row sample on large frames
+        
+        A deep scan sizes every Python object in object columns, which is
+        slow on wide string-heavy data; a few thousand rows estimate it closely.
+        """
+        if len(df) <= self.MEMORY_SAMPLE_ROWS or not (df.dtypes == object).any():
+            return int(df.memory_usage(deep=True).sum())
+        sample = df.sample(self.MEMORY_SAMPLE_ROWS, random_state=0)
+        per_row = sample.memory_usage(index=False, deep=True).sum() / self.MEMORY_SAMPLE_ROWS
+        return int(per_row * len(df) + df.index.memory_usage(deep=True))
+    
+    def _missing_counts(self, df: pd.DataFrame, data_summary: Optional[Dict] = None) -> tuple:
+        """Total missing cells and total cells, taken from the data summary when available"""
+        if data_summary is None:
+            return int(df.isnull().sum().sum()), df.size
+        return data_summary['total_missing'], data_summary['total_cells']
+    
+    def correlation_matrix(self, df: pd.DataFrame, numeric_cols: Optional[List] = None) -> pd.DataFrame:
+        """
+        Pearson correlation of the numeric columns using np.corrcoef
+        
+        The matrix is shared by the statistics and the heatmap, which run on
+        separate threads, so it is computed once per DataFrame under a lock.
+        Columns with missing values go through DataFrame.corr() instead, which
+        drops them pair by pair rather than discarding whole rows.
+        """
+        key = (id(df), df.shape)
+        with self._corr_lock:
+            if self._corr_cache is not None and self._corr_cache[0] == key:
+                return self._corr_cache[1]
+            
+            numeric_df = df[numeric_cols] if numeric_cols is not None else df.select_dtypes(include=['number'])
+            arr = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.isnan(arr).any():
+                corr_df = numeric_df.corr()
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr_mat = np.corrcoef(arr, rowvar=False)
+                corr_df = pd.DataFrame(
+                    np.atleast_2d(corr_mat), index=numeric_df.columns, columns=numeric_df.columns
+                )
+            
+            self._corr_cache = (key, corr_df)
+            return corr_df
+    
+    def run_statistical_analysis(self, df: pd.DataFrame, column_types: Optional[Dict] = None) -> Dict:
         """Run statistical analysis on the data"""
-        numeric_df = df.select_dtypes(include=['number'])
+        column_types = column_types or self.classify_columns(df)
+        numeric_df = df[column_types['numeric']]
         
         if numeric_df.empty:
             return {
@@ -182,30 +349,50 @@ class CrewAIIntegration:
                 'message': 'No numeric columns found for statistical analysis'
             }
         
-        # Basic statistics
-        summary_stats = numeric_df.describe().to_dict()
-        
         # Correlation analysis
-        correlations = numeric_df.corr().to_dict() if len(numeric_df.columns) > 1 else {}
+        correlations = (
+            self.correlation_matrix(df, column_types['numeric']).to_dict()
+            if len(numeric_df.columns) > 1 else {}
+        )
+        
+        # BI summaries don't need double precision, so large frames are
+        # processed as float32; the kernels still accumulate in float64
+        dtype = np.float32 if len(numeric_df) > self.FLOAT32_MIN_ROWS else np.float64
+        arr = numeric_df.to_numpy(dtype=dtype, na_value=np.nan)
+        
+        # Moments for every column in one sweep, order statistics in one partition
+        counts, means, stds, skewness, kurtosis = column_moments(arr)
+        mins, Q1, medians, Q3, maxs = column_quantiles(arr, [0, 0.25, 0.5, 0.75, 1])
+        
+        # Basic statistics, in the same layout as DataFrame.describe()
+        summary_stats = {
+            col: {
+                'count': n, 'mean': mean, 'std': std, 'min': lo,
+                '25%': q1, '50%': med, '75%': q3, 'max': hi
+            }
+            for col, n, mean, std, lo, q1, med, q3, hi in zip(
+                numeric_df.columns,
+                *(a.tolist() for a in (counts, means, stds, mins, Q1, medians, Q3, maxs))
+            )
+        }
         
         # Outlier detection using IQR method
-        outliers = {}
-        for col in numeric_df.columns:
-            Q1 = numeric_df[col].quantile(0.25)
-            Q3 = numeric_df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers[col] = len(numeric_df[(numeric_df[col] < lower_bound) | (numeric_df[col] > upper_bound)])
+        outlier_counts = column_outlier_counts(arr, Q1, Q3)
+        outliers = dict(zip(numeric_df.columns, outlier_counts.tolist()))
         
         # Distribution analysis
-        distributions = {}
-        for col in numeric_df.columns:
-            distributions[col] = {
-                'skewness': float(numeric_df[col].skew()),
-                'kurtosis': float(numeric_df[col].kurtosis()),
-                'is_normal': abs(numeric_df[col].skew()) < 0.5  # Simple normality check
+        is_normal = np.abs(skewness) < 0.5  # Simple normality check
+        
+        distributions = {
+            col: {
+                'skewness': sk,
+                'kurtosis': ku,
+                'is_normal': normal
             }
+            for col, sk, ku, normal in zip(
+                numeric_df.columns, skewness.tolist(), kurtosis.tolist(), is_normal.tolist()
+            )
+        }
         
         return {
             'summary_stats': summary_stats,
@@ -213,16 +400,16 @@ class CrewAIIntegration:
             'outliers': outliers,
             'distributions': distributions,
             'numeric_columns_count': len(numeric_df.columns),
-            'total_missing': numeric_df.isnull().sum().sum()
+            'total_missing': int(arr.size - counts.sum())
         }
     
-    def generate_business_insights(self, df: pd.DataFrame, stats: Dict) -> List[str]:
+    def generate_business_insights(self, df: pd.DataFrame, stats: Dict,
+                                   data_summary: Optional[Dict] = None) -> List[str]:
         """Generate business insights from the data"""
         insights = []
         
         # Data quality insights
-        total_cells = len(df) * len(df.columns)
-        missing_cells = df.isnull().sum().sum()
+        missing_cells, total_cells = self._missing_counts(df, data_summary)
         data_completeness = ((total_cells - missing_cells) / total_cells) * 100
         
         if data_completeness > 95:
@@ -242,12 +429,14 @@ class CrewAIIntegration:
         
         # Correlation insights
         if 'correlations' in stats and stats['correlations']:
-            high_corr_pairs = []
-            correlations = stats['correlations']
-            for col1 in correlations:
-                for col2 in correlations[col1]:
-                    if col1 != col2 and abs(correlations[col1][col2]) > 0.7:
-                        high_corr_pairs.append((col1, col2, correlations[col1][col2]))
+            # Scan the upper triangle only, so each pair of columns is tested once
+            corr_df = pd.DataFrame(stats['correlations'])
+            corr_mat = corr_df.to_numpy(dtype=np.float64)
+            iu = np.triu_indices_from(corr_mat, k=1)
+            strong = np.abs(corr_mat[iu]) > 0.7
+            high_corr_pairs = list(zip(
+                corr_df.index[iu[0][strong]], corr_df.columns[iu[1][strong]], corr_mat[iu][strong]
+            ))
             
             if high_corr_pairs:
                 insights.append(f"Found {len(high_corr_pairs)} strong correlations between variables")
@@ -266,68 +455,92 @@ class CrewAIIntegration:
         
         return insights
     
-    def create_visualizations(self, df: pd.DataFrame, options: Dict) -> Dict:
-        """Create visualizations based on the data and options"""
-        visualizations = {}
-        numeric_cols = df.select_dtypes(include=['number']).columns
-        categorical_cols = df.select_dtypes(include=['object']).columns
+    def create_visualizations(self, df: pd.DataFrame, options: Dict,
+                              column_types: Optional[Dict] = None) -> Dict:
+        """Create visualizations based on the data and options, as plotly JSON strings"""
+        # (name, figure factory) pairs, built concurrently below
+        jobs = []
+        column_types = column_types or self.classify_columns(df)
+        numeric_cols = column_types['numeric']
+        categorical_cols = column_types['object']
         
         chart_types = options.get('chart_types', ['Line Charts', 'Bar Charts'])
         
         # Correlation heatmap
         if len(numeric_cols) > 1 and 'Heatmaps' in chart_types:
-            corr_matrix = df[numeric_cols].corr()
-            visualizations['correlation_heatmap'] = px.imshow(
-                corr_matrix,
+            jobs.append(('correlation_heatmap', lambda: px.imshow(
+                self.correlation_matrix(df, numeric_cols),
                 title="Correlation Matrix",
                 color_continuous_scale="RdBu_r",
                 aspect="auto"
-            )
+            )))
         
         # Distribution plots
         if len(numeric_cols) > 0 and 'Distribution' in chart_types:
             for col in numeric_cols[:3]:  # Limit to first 3 columns
-                visualizations[f'distribution_{col}'] = px.histogram(
+                jobs.append((f'distribution_{col}', partial(
+                    px.histogram,
                     df, x=col,
                     title=f"Distribution of {col}",
                     nbins=30,
                     marginal="box"
-                )
+                )))
         
         # Bar charts for categorical data
         if len(categorical_cols) > 0 and 'Bar Charts' in chart_types:
             for col in categorical_cols[:2]:  # Limit to first 2 columns
-                value_counts = df[col].value_counts().head(10)
-                visualizations[f'bar_{col}'] = px.bar(
-                    x=value_counts.index,
-                    y=value_counts.values,
-                    title=f"Top Values in {col}"
-                )
+                jobs.append((f'bar_{col}', partial(self._top_values_bar, df[col], col)))
         
         # Scatter plots
         if len(numeric_cols) >= 2 and 'Scatter Plots' in chart_types:
-            visualizations['scatter_plot'] = px.scatter(
+            jobs.append(('scatter_plot', partial(
+                px.scatter,
                 df, x=numeric_cols[0], y=numeric_cols[1],
                 title=f"{numeric_cols[0]} vs {numeric_cols[1]}"
-            )
+            )))
         
         # Line charts (if there's a time component or sequential data)
         if len(numeric_cols) > 0 and 'Line Charts' in chart_types:
-            # Create a simple line chart with index
-            visualizations['trend_line'] = px.line(
-                df.head(100),  # Limit to 100 points for performance
+            # Create a simple line chart with index, striding across every row
+            # rather than plotting only the head of the frame
+            idx = np.linspace(0, len(df) - 1, min(self.TREND_LINE_POINTS, len(df))).astype(int)
+            jobs.append(('trend_line', partial(
+                px.line,
+                df.iloc[idx],
                 y=numeric_cols[0],
                 title=f"Trend Analysis: {numeric_cols[0]}"
-            )
+            )))
         
-        return visualizations
+        if not jobs:
+            return {}
+        
+        # Figures are independent, so build and serialize them in parallel.
+        # Serializing once here lets reruns and checkpoints reuse the plotly
+        # JSON instead of re-serializing the figures on every render.
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            figures = executor.map(lambda job: job[1]().to_json(), jobs)
+            return {name: fig_json for (name, _), fig_json in zip(jobs, figures)}
+    
+    @staticmethod
+    def _top_values_bar(values: pd.Series, col: str):
+        """Bar chart of the ten most frequent values in a column"""
+        value_counts = top_value_counts(values, 10)
+        return px.bar(
+            x=value_counts.index,
+            y=value_counts.values,
+            title=f"Top Values in {col}"
+        )
     
     def generate_final_report(self, df: pd.DataFrame, stats: Dict, 
-                            insights: List[str], options: Dict) -> str:
+                            insights: List[str], options: Dict,
+                            data_summary: Optional[Dict] = None,
+                            column_types: Optional[Dict] = None) -> str:
         """Generate comprehensive final report"""
+        column_types = column_types or self.classify_columns(df)
+        missing_cells, total_cells = self._missing_counts(df, data_summary)
         report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        report = f"""
+        parts = [f"""
 # Business Intelligence Analysis Report
 
 **Generated on:** {report_date}
@@ -341,22 +554,22 @@ This report presents a comprehensive analysis of your business data containing {
 
 - **Total Records:** {len(df):,}
 - **Total Columns:** {len(df.columns)}
-- **Numeric Columns:** {len(df.select_dtypes(include=['number']).columns)}
-- **Categorical Columns:** {len(df.select_dtypes(include=['object']).columns)}
-- **Data Completeness:** {((1 - df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100):.1f}%
+- **Numeric Columns:** {len(column_types['numeric'])}
+- **Categorical Columns:** {len(column_types['object'])}
+- **Data Completeness:** {((1 - missing_cells / total_cells) * 100):.1f}%
 
 ## Key Findings
 
-"""
+"""]
         
         # Add insights
         for i, insight in enumerate(insights, 1):
-            report += f"{i}. {insight}\n\n"
+            parts.append(f"{i}. {insight}\n\n")
         
         # Add statistical summary
         if 'summary_stats' in stats and stats['summary_stats']:
-            report += "\n## Statistical Summary\n\n"
-            report += "Key metrics for numeric columns:\n\n"
+            parts.append("\n## Statistical Summary\n\n")
+            parts.append("Key metrics for numeric columns:\n\n")
             
             for col, col_stats in stats['summary_stats'].items():
                 if isinstance(col_stats, dict):
@@ -365,48 +578,50 @@ This report presents a comprehensive analysis of your business data containing {
                     min_val = col_stats.get('min', 0)
                     max_val = col_stats.get('max', 0)
                     
-                    report += f"**{col}:**\n"
-                    report += f"- Mean: {mean_val:.2f}\n"
-                    report += f"- Standard Deviation: {std_val:.2f}\n"
-                    report += f"- Range: {min_val:.2f} to {max_val:.2f}\n\n"
+                    parts.append(f"**{col}:**\n")
+                    parts.append(f"- Mean: {mean_val:.2f}\n")
+                    parts.append(f"- Standard Deviation: {std_val:.2f}\n")
+                    parts.append(f"- Range: {min_val:.2f} to {max_val:.2f}\n\n")
         
         # Add correlation insights
         if 'correlations' in stats and stats['correlations']:
-            report += "\n## Correlation Analysis\n\n"
-            report += "Strong correlations detected between variables may indicate:\n"
-            report += "- Related business processes\n"
-            report += "- Potential redundancy in data collection\n"
-            report += "- Opportunities for predictive modeling\n\n"
+            parts.append("\n## Correlation Analysis\n\n")
+            parts.append("Strong correlations detected between variables may indicate:\n")
+            parts.append("- Related business processes\n")
+            parts.append("- Potential redundancy in data collection\n")
+            parts.append("- Opportunities for predictive modeling\n\n")
         
         # Add recommendations section
-        report += "\n## Strategic Recommendations\n\n"
-        report += "Based on our analysis, we recommend:\n\n"
-        report += "1. **Data Quality Enhancement:** "
-        if df.isnull().sum().sum() > 0:
-            report += "Address missing data to improve analysis accuracy\n"
+        parts.append("\n## Strategic Recommendations\n\n")
+        parts.append("Based on our analysis, we recommend:\n\n")
+        parts.append("1. **Data Quality Enhancement:** ")
+        if missing_cells > 0:
+            parts.append("Address missing data to improve analysis accuracy\n")
         else:
-            report += "Maintain current high data quality standards\n"
+            parts.append("Maintain current high data quality standards\n")
         
-        report += "2. **Process Optimization:** Focus on variables showing strong correlations\n"
-        report += "3. **Monitoring Setup:** Implement regular tracking of key metrics\n"
-        report += "4. **Further Analysis:** Consider advanced analytics for deeper insights\n\n"
+        parts.append("2. **Process Optimization:** Focus on variables showing strong correlations\n")
+        parts.append("3. **Monitoring Setup:** Implement regular tracking of key metrics\n")
+        parts.append("4. **Further Analysis:** Consider advanced analytics for deeper insights\n\n")
         
-        report += "\n## Methodology\n\n"
-        report += "This analysis was conducted using AI agents specialized in:\n"
-        report += "- **Data Analysis:** Statistical examination and pattern detection\n"
-        report += "- **Business Intelligence:** Insight generation and trend identification\n"
-        report += "- **Report Generation:** Comprehensive documentation and recommendations\n\n"
+        parts.append("\n## Methodology\n\n")
+        parts.append("This analysis was conducted using AI agents specialized in:\n")
+        parts.append("- **Data Analysis:** Statistical examination and pattern detection\n")
+        parts.append("- **Business Intelligence:** Insight generation and trend identification\n")
+        parts.append("- **Report Generation:** Comprehensive documentation and recommendations\n\n")
         
-        report += "---\n*Report generated by AI-Powered BI Dashboard*"
+        parts.append("---\n*Report generated by AI-Powered BI Dashboard*")
         
-        return report
+        return "".join(parts)
     
-    def generate_recommendations(self, df: pd.DataFrame, insights: List[str]) -> List[str]:
+    def generate_recommendations(self, df: pd.DataFrame, insights: List[str],
+                                 data_summary: Optional[Dict] = None,
+                                 column_types: Optional[Dict] = None) -> List[str]:
         """Generate actionable recommendations"""
         recommendations = []
         
         # Data quality recommendations
-        missing_data = df.isnull().sum().sum()
+        missing_data, _ = self._missing_counts(df, data_summary)
         if missing_data > 0:
             recommendations.append(f"Address {missing_data} missing values to improve data completeness")
         
@@ -415,7 +630,8 @@ This report presents a comprehensive analysis of your business data containing {
             recommendations.append("Consider collecting more data for more robust statistical analysis")
         
         # Column-based recommendations
-        numeric_cols = len(df.select_dtypes(include=['number']).columns)
+        column_types = column_types or self.classify_columns(df)
+        numeric_cols = len(column_types['numeric'])
         if numeric_cols == 0:
             recommendations.append("Add numeric metrics to enable quantitative analysis")
         elif numeric_cols < 3:
@@ -460,13 +676,16 @@ def create_progress_tracker():
     
     return update_progress
 
-def run_crew_analysis(df: pd.DataFrame, analysis_options: Dict) -> Optional[Dict]:
+def run_crew_analysis(df: pd.DataFrame, analysis_options: Dict,
+                      progress_cb: Optional[Callable[[str, int], None]] = None) -> Optional[Dict]:
     """
     Main function to run CrewAI analysis with Streamlit integration
     
     Args:
         df: Pandas DataFrame with uploaded data
         analysis_options: Dictionary with analysis preferences
+        progress_cb: Optional callback receiving (message, percent) as each
+            pipeline stage completes; a Streamlit tracker is created if omitted
         
     Returns:
         Analysis results or None if failed
@@ -476,8 +695,9 @@ def run_crew_analysis(df: pd.DataFrame, analysis_options: Dict) -> Optional[Dict
         crew_integration = CrewAIIntegration()
         
         # Set up progress tracking
-        progress_callback = create_progress_tracker()
-        crew_integration.set_progress_callback(progress_callback)
+        if progress_cb is None:
+            progress_cb = create_progress_tracker()
+        crew_integration.set_progress_callback(progress_cb)
         
         # Run analysis
         results = crew_integration.analyze_csv_data(df, analysis_options)
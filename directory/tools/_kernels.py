@@ -0,0 +1,201 @@
+"""
+Per-column statistics kernels for the numeric block of a DataFrame.
+
+When Numba is installed the moment sums and the IQR outlier counts are
+JIT-compiled into single sweeps per column, run in parallel across columns.
+Without Numba the same results are produced with vectorized NumPy.
+NaNs are skipped everywhere, matching pandas' default behaviour.
+float32 input is read as-is; deviations and sums are always taken in float64.
+"""
+import os
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_USER_LAYER_VARS = ('NUMBA_THREADING_LAYER', 'NUMBA_THREADING_LAYER_PRIORITY')
+_layer_lock = threading.Lock()
+_layer_checked = False
+
+
+def _prefer_omp_layer():
+    """
+    Prefer Numba's OpenMP threading layer, right before the first kernel launch.
+
+    Streamlit calls the kernels from script and worker threads, and the TBB
+    layer can hang interpreter shutdown in that case. Nothing is changed if
+    the user picked a layer through the environment, or if Numba's threads
+    were already launched (the layer is fixed by then).
+    """
+    global _layer_checked
+    if _layer_checked:
+        return
+    with _layer_lock:
+        if _layer_checked or any(var in os.environ for var in _USER_LAYER_VARS):
+            _layer_checked = True
+            return
+        from numba.np.ufunc import parallel
+        if not parallel._is_initialized:
+            numba.config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+        _layer_checked = True
+
+
+# Every fastmath flag except 'nnan': the kernels rely on NaN checks
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _raw_moments(arr):
+        n_rows, n_cols = arr.shape
+        count = np.zeros(n_cols)
+        mean = np.full(n_cols, np.nan)
+        m2 = np.full(n_cols, np.nan)
+        m3 = np.full(n_cols, np.nan)
+        m4 = np.full(n_cols, np.nan)
+        for j in prange(n_cols):
+            c = 0
+            total = 0.0
+            for i in range(n_rows):
+                v = arr[i, j]
+                if not np.isnan(v):
+                    c += 1
+                    total += v
+            if c > 0:
+                mu = total / c
+                s2 = 0.0
+                s3 = 0.0
+                s4 = 0.0
+                for i in range(n_rows):
+                    v = arr[i, j]
+                    if not np.isnan(v):
+                        d = v - mu
+                        d2 = d * d
+                        s2 += d2
+                        s3 += d2 * d
+                        s4 += d2 * d2
+                count[j] = c
+                mean[j] = mu
+                m2[j] = s2 / c
+                m3[j] = s3 / c
+                m4[j] = s4 / c
+        return count, mean, m2, m3, m4
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _outlier_counts(arr, lower, upper):
+        n_rows, n_cols = arr.shape
+        counts = np.zeros(n_cols, dtype=np.int64)
+        for j in prange(n_cols):
+            lo = lower[j]
+            hi = upper[j]
+            c = 0
+            for i in range(n_rows):
+                v = arr[i, j]
+                if v < lo or v > hi:
+                    c += 1
+            counts[j] = c
+        return counts
+
+else:
+    def _raw_moments(arr):
+        count = np.count_nonzero(~np.isnan(arr), axis=0).astype(np.float64)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+            mean = np.nanmean(arr, axis=0, dtype=np.float64)
+            # Deviations in float64: float32 fourth powers overflow on large values
+            d = arr.astype(np.float64) - mean
+            d2 = d * d
+            m2 = np.nanmean(d2, axis=0, dtype=np.float64)
+            m3 = np.nanmean(d2 * d, axis=0, dtype=np.float64)
+            m4 = np.nanmean(d2 * d2, axis=0, dtype=np.float64)
+        return count, mean, m2, m3, m4
+
+    def _outlier_counts(arr, lower, upper):
+        return ((arr < lower) | (arr > upper)).sum(axis=0)
+
+
+def _as_float_columns(arr):
+    """Column-major float array, keeping float32 input instead of upcasting"""
+    arr = np.asarray(arr)
+    if arr.dtype not in (np.float32, np.float64):
+        arr = arr.astype(np.float64)
+    return np.asfortranarray(arr)
+
+
+def column_moments(arr):
+    """
+    Count, mean, sample std, skewness and excess kurtosis of each column.
+
+    Skewness and kurtosis use the same bias corrections as pandas'
+    Series.skew() / Series.kurtosis(): constant columns report 0, and
+    columns with too few observations report NaN.
+    """
+    arr = _as_float_columns(arr)
+    if NUMBA_AVAILABLE:
+        _prefer_omp_layer()
+    n, mean, m2, m3, m4 = _raw_moments(arr)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+        max_abs = np.fmax(np.abs(np.nanmax(arr, axis=0)), np.abs(np.nanmin(arr, axis=0)))
+    # A variance at rounding level relative to the data's magnitude means a
+    # constant column; that only guards the skew/kurtosis division, std keeps m2
+    scale = np.fmax(mean * mean, max_abs.astype(np.float64) ** 2)
+    constant = m2 <= np.finfo(np.float64).eps * scale
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.sqrt(m2 * n / (n - 1))
+        skew = m3 / m2 ** 1.5 * np.sqrt(n * (n - 1)) / (n - 2)
+        kurt = ((n + 1) * (m4 / m2 ** 2 - 3) + 6) * (n - 1) / ((n - 2) * (n - 3))
+    std = np.where(n < 2, np.nan, std)
+    skew = np.where(n < 3, np.nan, np.where(constant, 0.0, skew))
+    kurt = np.where(n < 4, np.nan, np.where(constant, 0.0, kurt))
+    return n.astype(np.int64), mean, std, skew, kurt
+
+
+def column_quantiles(arr, q):
+    """
+    NaN-skipping quantiles of each column, one row per entry of q.
+
+    Uses linear interpolation like DataFrame.quantile(); all-missing
+    columns report NaN.
+    """
+    arr = _as_float_columns(arr)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+        return np.nanquantile(arr, q, axis=0)
+
+
+def column_outlier_counts(arr, q1, q3):
+    """Number of values per column outside the 1.5 * IQR fences"""
+    arr = _as_float_columns(arr)
+    q1 = np.asarray(q1, dtype=np.float64)
+    q3 = np.asarray(q3, dtype=np.float64)
+    iqr = q3 - q1
+    if NUMBA_AVAILABLE:
+        _prefer_omp_layer()
+    return _outlier_counts(arr, q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+
+
+def top_value_counts(values, n):
+    """
+    The n most frequent non-null values, most frequent first.
+
+    Equivalent to values.value_counts().head(n), but counts integer codes
+    with bincount and partially sorts them, rather than sorting every
+    distinct value of a high-cardinality column.
+    """
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    if counts.size > n:
+        idx = np.argpartition(-counts, n)[:n]
+    else:
+        idx = np.arange(counts.size)
+    idx = idx[np.argsort(-counts[idx], kind='stable')]
+    return pd.Series(counts[idx], index=uniques[idx], name='count')
@@ -1,8 +1,70 @@
 
 # src/bi_dashboard_crew/tools/csv_analysis_tool.py
+import json
+import os
+from collections import Counter
+import numpy as np
 import pandas as pd
 from crewai.tools import tool
 
+# Files larger than this are summarized chunk by chunk rather than loaded whole
+STREAM_MIN_BYTES = 256 * 1024 * 1024
+CHUNK_ROWS = 100_000
+# Medians come from a uniform sample of at most this many values per column;
+# columns with fewer values get the exact median
+MEDIAN_SAMPLE_SIZE = 1_000_000
+
+def _read_csv(file_path: str) -> pd.DataFrame:
+    """Parse with the multi-threaded pyarrow engine into Arrow-backed columns, falling back to the C parser"""
+    try:
+        return pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow')
+    except (ImportError, ValueError):
+        # pyarrow missing or unable to parse this file
+        return pd.read_csv(file_path)
+
+def _iter_csv(file_path: str):
+    """Yield the CSV as DataFrames: whole for small files, in row chunks for large ones"""
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        size = 0
+    
+    if size > STREAM_MIN_BYTES:
+        # The pyarrow engine can't stream, so large files use the chunked C parser
+        yield from pd.read_csv(file_path, chunksize=CHUNK_ROWS)
+    else:
+        yield _read_csv(file_path)
+
+def _merge_moments(acc: list, values: np.ndarray):
+    """Fold a chunk into running [count, mean, sum of squared deviations] (Chan et al.)"""
+    n_b = values.size
+    if n_b == 0:
+        return
+    mean_b = values.mean()
+    m2_b = np.square(values - mean_b).sum()
+    n_a, mean_a, m2_a = acc
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    acc[0] = n
+    acc[1] = mean_a + delta * n_b / n
+    acc[2] = m2_a + m2_b + delta * delta * n_a * n_b / n
+
+def _sample_values(sample: list, values: np.ndarray, rng: np.random.Generator):
+    """Fold a chunk into a bounded uniform reservoir sample [values, seen] (Algorithm R)"""
+    reservoir, seen = sample
+    take = min(MEDIAN_SAMPLE_SIZE - reservoir.size, values.size)
+    if take:
+        reservoir = np.concatenate([reservoir, values[:take]])
+    rest = values[take:]
+    if rest.size:
+        # Item i lands in a random slot with probability k / (i + 1); on repeated
+        # slots the later item wins, matching the one-at-a-time algorithm
+        slots = rng.integers(0, np.arange(seen + take, seen + values.size) + 1)
+        keep = slots < MEDIAN_SAMPLE_SIZE
+        reservoir[slots[keep]] = rest[keep]
+    sample[0] = reservoir
+    sample[1] = seen + values.size
+
 @tool("CSV Summary Analysis")
 def csv_summary_tool(file_path: str) -> str:
     """
@@ -12,48 +74,75 @@ def csv_summary_tool(file_path: str) -> str:
         file_path (str): Path to the CSV file to analyze
         
     Returns:
-        str: Summary statistics and insights from the CSV file
+        str: JSON object with summary statistics and insights from the CSV file
     """
     try:
-        df = pd.read_csv(file_path)
+        columns = None
+        original_rows = 0
+        cleaned_rows = 0
+        sales_total = 0.0
+        product_counts = Counter()
+        numeric_cols = None
+        moments = {}
+        samples = {}
+        rng = np.random.default_rng(0)
         
-        # Basic cleaning
-        original_rows = len(df)
-        df = df.dropna()
-        cleaned_rows = len(df)
+        # Reduce each chunk into running totals, so large files are never held in memory whole
+        for chunk in _iter_csv(file_path):
+            if columns is None:
+                columns = list(chunk.columns)
+                sales_cols = [col for col in columns if 'sales' in col.lower()]
+                product_cols = [col for col in columns if 'product' in col.lower()]
+            
+            # Basic cleaning
+            original_rows += len(chunk)
+            chunk = chunk.dropna()
+            cleaned_rows += len(chunk)
+            
+            # Sales analysis
+            if sales_cols:
+                sales_total += float(chunk[sales_cols[0]].sum())
+            
+            # Product analysis
+            if product_cols:
+                product_counts.update(chunk[product_cols[0]].value_counts(sort=False).to_dict())
+            
+            # Numeric column analysis; a column counts as numeric only if it parses as numeric in every chunk
+            chunk_numeric = chunk.select_dtypes(include=['number']).columns
+            if numeric_cols is None:
+                numeric_cols = [col for col in chunk_numeric if col.lower() not in ['sales']]
+            else:
+                numeric_cols = [col for col in numeric_cols if col in chunk_numeric]
+            for col in numeric_cols:
+                values = chunk[col].to_numpy(dtype=np.float64)
+                _merge_moments(moments.setdefault(col, [0, 0.0, 0.0]), values)
+                # Bounded sample for the median, so memory doesn't grow with the file
+                _sample_values(samples.setdefault(col, [np.empty(0), 0]), values, rng)
         
         summary = {
-            'File Info': f"Original rows: {original_rows}, After cleaning: {cleaned_rows}",
-            'Columns': list(df.columns)
+            'File Info': {'Original Rows': original_rows, 'After Cleaning': cleaned_rows},
+            'Columns': columns or []
         }
         
-        # Sales analysis
-        sales_cols = [col for col in df.columns if 'sales' in col.lower()]
-        if sales_cols:
-            total_sales = df[sales_cols[0]].sum()
-            avg_sales = df[sales_cols[0]].mean()
-            summary['Total Sales'] = f"${total_sales:,.2f}"
-            summary['Average Sales'] = f"${avg_sales:,.2f}"
+        if columns and sales_cols:
+            summary['Total Sales'] = round(sales_total, 2)
+            summary['Average Sales'] = round(sales_total / cleaned_rows, 2) if cleaned_rows else float('nan')
         
         summary['Number of Transactions'] = cleaned_rows
         
-        # Product analysis
-        product_cols = [col for col in df.columns if 'product' in col.lower()]
-        if product_cols:
-            top_products = df[product_cols[0]].value_counts().head(100).to_dict()
-            summary['Top 100 Products'] = top_products
-        
-        # Numeric column analysis
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        for col in numeric_cols:
-            if col.lower() not in ['sales']:
-                summary[f'{col}_stats'] = {
-                    'mean': round(df[col].mean(), 2),
-                    'median': round(df[col].median(), 2),
-                    'std': round(df[col].std(), 2)
-                }
-        
-        return str(summary)
+        if columns and product_cols:
+            summary['Top 100 Products'] = dict(product_counts.most_common(100))
+        
+        for col in numeric_cols or []:
+            n, mean, m2 = moments[col]
+            values = samples[col][0]
+            summary[f'{col}_stats'] = {
+                'mean': round(mean, 2) if n else float('nan'),
+                'median': round(float(np.median(values)), 2) if n else float('nan'),
+                'std': round(float(np.sqrt(m2 / (n - 1))), 2) if n > 1 else float('nan')
+            }
+        
+        return json.dumps(summary, default=str)
         
     except Exception as e:
         return f"Error processing CSV: {str(e)}"
@@ -1,39 +1,40 @@
 
 # src/bi_dashboard_crew/tools/report_tools.py
 from crewai.tools import tool
-from datetime import datetime
-
-@tool("Report Formatter Tool")
-def report_formatter_tool(analysis_data: str, insights: str, trends: str) -> str:
-    """Creates a formatted business report."""
-    try:
-        report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        report = f"""
-================================================================================
+from datetime import date, datetime
+from functools import lru_cache
+from string import Formatter
+import io
+import time
+
+# Constant report text, formatted once per call with the dynamic sections
+_SEP = "=" * 80
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_REPORT_TEMPLATE = f"""\
+{_SEP}
                            BUSINESS INTELLIGENCE REPORT
-================================================================================
-Generated on: {report_date}
+{_SEP}
+Generated on: {{report_date}}
 
 EXECUTIVE SUMMARY
-================================================================================
+{_SEP}
 Comprehensive analysis of business data with statistical summaries, 
 insights, and strategic recommendations.
 
 DATA ANALYSIS RESULTS
-================================================================================
-{analysis_data}
+{_SEP}
+{{analysis_data}}
 
 BUSINESS INSIGHTS
-================================================================================
-{insights}
+{_SEP}
+{{insights}}
 
 TREND ANALYSIS
-================================================================================
-{trends}
+{_SEP}
+{{trends}}
 
 STRATEGIC RECOMMENDATIONS
-================================================================================
+{_SEP}
 1. DATA STRATEGY
    - Implement data quality monitoring
    - Establish regular cleaning procedures
@@ -50,25 +51,19 @@ STRATEGIC RECOMMENDATIONS
    - Train staff on data-driven decisions
 
 CONCLUSION
-================================================================================
+{_SEP}
 Analysis reveals important business patterns for strategic decision-making.
 Regular monitoring recommended for continued optimization.
 
 Report by: CrewAI Business Intelligence System
-================================================================================
-        """
-        
-        return report.strip()
-        
-    except Exception as e:
-        return f"Error generating report: {str(e)}"
-
-@tool("Executive Summary Tool")
-def executive_summary_tool(full_report: str) -> str:
-    """Creates executive summary from full report."""
-    try:
-        summary = f"""
-EXECUTIVE SUMMARY - {datetime.now().strftime("%Y-%m-%d")}
+{_SEP}"""
+# (literal text, field name) pairs of the template, parsed once at import
+_REPORT_PARTS = tuple(
+    (literal, field) for literal, field, _, _ in Formatter().parse(_REPORT_TEMPLATE)
+)
+
+_SUMMARY_TEMPLATE = """\
+EXECUTIVE SUMMARY - {summary_date}
 ==================================================
 
 KEY FINDINGS:
@@ -86,10 +81,52 @@ BUSINESS IMPACT:
 - Improved operational efficiency
 - Strategic planning support
 
-Next Steps: Implement recommendations and schedule follow-up.
-        """
+Next Steps: Implement recommendations and schedule follow-up."""
+
+@lru_cache(maxsize=4)
+def _format_timestamp(second: int, fmt: str) -> str:
+    """strftime once per second and format, however often the tools are called"""
+    return datetime.fromtimestamp(second).strftime(fmt)
+
+# Agents often retry a tool with identical arguments. Results are cached per
+# minute, so those retries are served from the cache and a cached report's
+# timestamp is at most a minute old
+@lru_cache(maxsize=256)
+def _format_report(minute: int, analysis_data: str, insights: str, trends: str) -> str:
+    values = {
+        'report_date': _format_timestamp(int(time.time()), _TIMESTAMP_FORMAT),
+        'analysis_data': analysis_data,
+        'insights': insights,
+        'trends': trends
+    }
+    
+    # Write the fixed and dynamic sections into one buffer
+    buf = io.StringIO()
+    for literal, field in _REPORT_PARTS:
+        buf.write(literal)
+        if field is not None:
+            buf.write(values[field])
+    return buf.getvalue()
+
+# The summary doesn't depend on the report it's given, only on the date
+@lru_cache(maxsize=1)
+def _executive_summary(summary_date: str) -> str:
+    return _SUMMARY_TEMPLATE.format(summary_date=summary_date)
+
+@tool("Report Formatter Tool")
+def report_formatter_tool(analysis_data: str, insights: str, trends: str) -> str:
+    """Creates a formatted business report."""
+    try:
+        return _format_report(int(time.time() // 60), analysis_data, insights, trends)
         
-        return summary.strip()
+    except Exception as e:
+        return f"Error generating report: {str(e)}"
+
+@tool("Executive Summary Tool")
+def executive_summary_tool(full_report: str) -> str:
+    """Creates executive summary from full report."""
+    try:
+        return _executive_summary(date.today().isoformat())
         
     except Exception as e:
         return f"Error generating summary: {str(e)}"
\ No newline at end of file
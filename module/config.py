@@ -3,142 +3,215 @@ Configuration file for AI-Powered BI Dashboard
 """
 
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class Config:
-    """Application configuration"""
+    """Application configuration, built once by get_config() and shared read-only"""
     
     # Streamlit Configuration
-    STREAMLIT_PORT = os.getenv('STREAMLIT_SERVER_PORT', 8501)
-    STREAMLIT_ADDRESS = os.getenv('STREAMLIT_SERVER_ADDRESS', 'localhost')
+    STREAMLIT_PORT: int
+    STREAMLIT_ADDRESS: str
     
     # API Keys
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", '')
+    GEMINI_API_KEY: str
     
     # CrewAI Configuration
-    CREW_VERBOSE = os.getenv('CREW_VERBOSE', 'True').lower() == 'true'
-    CREW_MEMORY = os.getenv('CREW_MEMORY', 'True').lower() == 'true'
+    CREW_VERBOSE: bool
+    CREW_MEMORY: bool
     
     # File Upload Configuration
-    MAX_FILE_SIZE_MB = int(os.getenv('MAX_FILE_SIZE_MB', 200))
-    ALLOWED_FILE_TYPES = ['csv']
+    MAX_FILE_SIZE_MB: int
+    ALLOWED_FILE_TYPES: frozenset = frozenset({'csv'})  # membership checks on upload
     
     # Analysis Configuration
-    DEFAULT_ANALYSIS_DEPTH = 'Basic'
-    DEFAULT_CHART_TYPES = ['Line Charts', 'Bar Charts']
-    MAX_VISUALIZATION_POINTS = int(os.getenv('MAX_VIZ_POINTS', 1000))
+    DEFAULT_ANALYSIS_DEPTH: str = 'Basic'
+    DEFAULT_CHART_TYPES: tuple = ('Line Charts', 'Bar Charts')
+    MAX_VISUALIZATION_POINTS: int
     
     # Performance Configuration
-    ENABLE_CACHING = os.getenv('ENABLE_CACHING', 'True').lower() == 'true'
-    CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', 3600))
+    ENABLE_CACHING: bool
+    CACHE_TTL_SECONDS: int
     
     # UI Configuration
-    APP_TITLE = "AI-Powered Business Intelligence Dashboard"
-    APP_ICON = "📊"
-    SIDEBAR_STATE = "expanded"
+    APP_TITLE: str = "AI-Powered Business Intelligence Dashboard"
+    APP_ICON: str = "📊"
+    SIDEBAR_STATE: str = "expanded"
     
     # Report Configuration
-    REPORT_FORMATS = ['txt', 'csv', 'json', 'pdf']
-    DEFAULT_REPORT_FORMAT = 'txt'
+    REPORT_FORMATS: tuple = ('txt', 'csv', 'json', 'pdf')
+    DEFAULT_REPORT_FORMAT: str = 'txt'
     
     # Chart Configuration
-    CHART_THEMES = ['plotly', 'plotly_white', 'plotly_dark', 'ggplot2', 'seaborn']
-    DEFAULT_CHART_THEME = 'plotly'
+    CHART_THEMES: tuple = ('plotly', 'plotly_white', 'plotly_dark', 'ggplot2', 'seaborn')
+    DEFAULT_CHART_THEME: str = 'plotly'
     
     # Data Processing Configuration
-    SAMPLE_SIZE_LARGE_FILES = int(os.getenv('SAMPLE_SIZE', 10000))
-    CORRELATION_THRESHOLD = float(os.getenv('CORRELATION_THRESHOLD', 0.7))
-    OUTLIER_METHOD = 'IQR'  # 'IQR' or 'zscore'
+    SAMPLE_SIZE_LARGE_FILES: int
+    CORRELATION_THRESHOLD: float
+    OUTLIER_METHOD: str = 'IQR'  # 'IQR' or 'zscore'
     
-    @classmethod
-    def validate_config(cls):
+    def validate_config(self):
         """Validate configuration settings"""
         errors = []
         
         # Check required API keys for production
-        if not cls.OPENAI_API_KEY and not cls.ANTHROPIC_API_KEY:
-            errors.append("No API keys configured. At least one AI provider key is recommended.")
+        if not self.GEMINI_API_KEY:
+            errors.append("No GEMINI_API_KEY configured. It is required for AI analysis unless entered in the app.")
         
         # Validate numeric settings
-        if cls.MAX_FILE_SIZE_MB <= 0:
+        if self.MAX_FILE_SIZE_MB <= 0:
             errors.append("MAX_FILE_SIZE_MB must be positive")
         
-        if cls.CORRELATION_THRESHOLD < 0 or cls.CORRELATION_THRESHOLD > 1:
+        if self.CORRELATION_THRESHOLD < 0 or self.CORRELATION_THRESHOLD > 1:
             errors.append("CORRELATION_THRESHOLD must be between 0 and 1")
         
         return errors
 
+@cache
+def _load_dotenv():
+    """Load variables from .env once, without overriding ones already set"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        # Settings come from the real environment only
+        return
+    load_dotenv(override=False)
+
+def _load_env() -> dict:
+    """Environment-driven settings, cast from a single snapshot of os.environ"""
+    env = os.environ.copy()
+    
+    def flag(name):
+        return env.get(name, 'True').lower() == 'true'
+    
+    return {
+        'STREAMLIT_PORT': int(env.get('STREAMLIT_SERVER_PORT', 8501)),
+        'STREAMLIT_ADDRESS': env.get('STREAMLIT_SERVER_ADDRESS', 'localhost'),
+        'GEMINI_API_KEY': env.get('GEMINI_API_KEY', ''),
+        'CREW_VERBOSE': flag('CREW_VERBOSE'),
+        'CREW_MEMORY': flag('CREW_MEMORY'),
+        'MAX_FILE_SIZE_MB': int(env.get('MAX_FILE_SIZE_MB', 200)),
+        'MAX_VISUALIZATION_POINTS': int(env.get('MAX_VIZ_POINTS', 1000)),
+        'ENABLE_CACHING': flag('ENABLE_CACHING'),
+        'CACHE_TTL_SECONDS': int(env.get('CACHE_TTL_SECONDS', 3600)),
+        'SAMPLE_SIZE_LARGE_FILES': int(env.get('SAMPLE_SIZE', 10000)),
+        'CORRELATION_THRESHOLD': float(env.get('CORRELATION_THRESHOLD', 0.7))
+    }
+
+@cache
+def get_config():
+    """Get the configuration instance, built and validated once per process"""
+    _load_dotenv()
+    settings = Config(**_load_env())
+    # Validation only warns, so optimized runs (python -O) skip it
+    errors = settings.validate_config() if __debug__ else []
+    if errors:
+        print("Configuration warnings:")
+        for error in errors:
+            print(f"  - {error}")
+    
+    return settings
+
+def __getattr__(name):
+    """Export `config` lazily, so importing this module doesn't read the environment"""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Analysis Templates
-ANALYSIS_TEMPLATES = {
-    'Basic': {
+ANALYSIS_TEMPLATES = MappingProxyType({
+    'Basic': MappingProxyType({
         'description': 'Quick overview with essential statistics',
-        'includes': ['summary_stats', 'basic_insights', 'simple_charts'],
+        'includes': ('summary_stats', 'basic_insights', 'simple_charts'),
         'estimated_time': '1-2 minutes'
-    },
-    'Detailed': {
+    }),
+    'Detailed': MappingProxyType({
         'description': 'Comprehensive analysis with correlations',
-        'includes': ['summary_stats', 'correlations', 'outliers', 'distributions', 'insights'],
+        'includes': ('summary_stats', 'correlations', 'outliers', 'distributions', 'insights'),
         'estimated_time': '3-5 minutes'
-    },
-    'Comprehensive': {
+    }),
+    'Comprehensive': MappingProxyType({
         'description': 'Full analysis with predictive insights',
-        'includes': ['all_features', 'advanced_analytics', 'predictions', 'recommendations'],
+        'includes': ('all_features', 'advanced_analytics', 'predictions', 'recommendations'),
         'estimated_time': '5-10 minutes'
-    }
-}
+    })
+})
 
 # Chart Type Configurations
-CHART_CONFIGS = {
-    'Line Charts': {
-        'suitable_for': ['time_series', 'trends', 'continuous_data'],
+CHART_CONFIGS = MappingProxyType({
+    'Line Charts': MappingProxyType({
+        'suitable_for': ('time_series', 'trends', 'continuous_data'),
         'min_columns': 1,
-        'data_types': ['numeric']
-    },
-    'Bar Charts': {
-        'suitable_for': ['categorical_comparison', 'counts', 'frequencies'],
+        'data_types': ('numeric',)
+    }),
+    'Bar Charts': MappingProxyType({
+        'suitable_for': ('categorical_comparison', 'counts', 'frequencies'),
         'min_columns': 1,
-        'data_types': ['categorical', 'numeric']
-    },
-    'Scatter Plots': {
-        'suitable_for': ['relationships', 'correlations', 'patterns'],
+        'data_types': ('categorical', 'numeric')
+    }),
+    'Scatter Plots': MappingProxyType({
+        'suitable_for': ('relationships', 'correlations', 'patterns'),
         'min_columns': 2,
-        'data_types': ['numeric']
-    },
-    'Heatmaps': {
-        'suitable_for': ['correlations', 'matrix_data', 'patterns'],
+        'data_types': ('numeric',)
+    }),
+    'Heatmaps': MappingProxyType({
+        'suitable_for': ('correlations', 'matrix_data', 'patterns'),
         'min_columns': 2,
-        'data_types': ['numeric']
-    },
-    'Distribution': {
-        'suitable_for': ['data_distribution', 'normality', 'outliers'],
+        'data_types': ('numeric',)
+    }),
+    'Distribution': MappingProxyType({
+        'suitable_for': ('data_distribution', 'normality', 'outliers'),
         'min_columns': 1,
-        'data_types': ['numeric']
-    }
-}
+        'data_types': ('numeric',)
+    })
+})
 
-# Error Messages
-ERROR_MESSAGES = {
-    'file_too_large': f"File size exceeds {Config.MAX_FILE_SIZE_MB}MB limit",
-    'invalid_format': f"Invalid file format. Supported: {Config.ALLOWED_FILE_TYPES}",
+# Error Messages, filled in from the configuration when first looked up
+_ERROR_TEMPLATES = MappingProxyType({
+    'file_too_large': "File size exceeds {max_file_size_mb}MB limit",
+    'invalid_format': "Invalid file format. Supported: {allowed_file_types}",
     'empty_file': "Uploaded file is empty",
     'no_numeric_data': "No numeric columns found for analysis",
     'insufficient_data': "Insufficient data for meaningful analysis",
     'analysis_failed': "Analysis failed. Please try again or contact support"
-}
+})
+
+class _LazyErrorMessages(Mapping):
+    """Read-only mapping of error messages, formatted on first access"""
+    
+    def __getitem__(self, key):
+        return _error_message(key)
+    
+    def __iter__(self):
+        return iter(_ERROR_TEMPLATES)
+    
+    def __len__(self):
+        return len(_ERROR_TEMPLATES)
+
+@cache
+def _error_message(key):
+    settings = get_config()
+    return _ERROR_TEMPLATES[key].format(
+        max_file_size_mb=settings.MAX_FILE_SIZE_MB,
+        allowed_file_types=", ".join(sorted(settings.ALLOWED_FILE_TYPES))
+    )
+
+ERROR_MESSAGES = _LazyErrorMessages()
 
 # Success Messages
-SUCCESS_MESSAGES = {
+SUCCESS_MESSAGES = MappingProxyType({
     'upload_success': "✅ File uploaded successfully",
     'analysis_complete': "✅ Analysis completed successfully",
     'report_generated': "✅ Report generated successfully",
     'download_ready': "✅ Download ready"
-}
+})
 
 # UI Text and Labels
-UI_TEXT = {
+UI_TEXT = MappingProxyType({
     'upload_instructions': """
     #### 📋 Instructions:
     1. **Upload CSV**: Select your business data file
@@ -151,25 +224,12 @@ UI_TEXT = {
     **What you'll get:** Automated insights, visualizations, and comprehensive reports
     """,
     'footer_text': "Powered by CrewAI Agents • Built with Streamlit"
-}
+})
 
 # Validation Rules
-VALIDATION_RULES = {
+VALIDATION_RULES = MappingProxyType({
     'min_rows': 10,
     'min_columns': 2,
     'max_missing_percentage': 80,  # Maximum percentage of missing data allowed
     'min_numeric_columns': 1
-}
-
-def get_config():
-    """Get configuration instance with validation"""
-    errors = Config.validate_config()
-    if errors:
-        print("Configuration warnings:")
-        for error in errors:
-            print(f"  - {error}")
-    
-    return Config
-
-# Export configuration
-config = get_config()
\ No newline at end of file
+})
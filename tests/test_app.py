@@ -0,0 +1,28 @@
+import unittest
+
+import pandas as pd
+
+try:
+    import app
+except ImportError:  # pysqlite3 / streamlit not installed
+    app = None
+
+
+@unittest.skipIf(app is None, "app dependencies not installed")
+class ClassifyColumnsTest(unittest.TestCase):
+
+    def test_string_dtype_columns_are_categorical(self):
+        df = pd.DataFrame({
+            'Branch': pd.array(['A', 'B', 'C'], dtype='string'),
+            'City': pd.Series(['Yangon', 'Mandalay', None], dtype=object),
+            'Total': [1.5, 2.5, 3.5],
+            'Quantity': [1, 2, 3],
+            'Member': [True, False, True],
+        })
+        dtype_info = app.classify_columns(df)
+        self.assertEqual(dtype_info['categorical'], ['Branch', 'City'])
+        self.assertEqual(dtype_info['numeric'], ['Total', 'Quantity'])
+
+
+if __name__ == '__main__':
+    unittest.main()
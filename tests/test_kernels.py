@@ -0,0 +1,59 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+KERNELS_PATH = Path(__file__).resolve().parents[1] / 'directory' / 'tools' / '_kernels.py'
+
+
+def _load_numpy_kernels():
+    """Load the kernels module from its file with Numba hidden, forcing the NumPy fallback"""
+    # Loaded directly so the tools package (and its crewai import) is not needed
+    spec = importlib.util.spec_from_file_location('_kernels_numpy', KERNELS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {'numba': None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class ColumnMomentsTest(unittest.TestCase):
+
+    def test_large_float32_values_match_pandas(self):
+        # Census-tract style identifiers: their fourth powers overflow float32
+        rng = np.random.default_rng(0)
+        values = rng.choice([5.3033e10, 5.3061e10, 5.3067e10], size=5000, p=[0.9, 0.09, 0.01])
+        values[::97] = np.nan
+        arr = values.astype(np.float32).reshape(-1, 1)
+        expected = pd.Series(arr[:, 0].astype(np.float64))
+
+        kernels = _load_numpy_kernels()
+        self.assertFalse(kernels.NUMBA_AVAILABLE)
+        count, mean, std, skew, kurt = kernels.column_moments(arr)
+        self.assertEqual(count[0], expected.count())
+        self.assertTrue(np.isfinite(kurt[0]))
+        np.testing.assert_allclose(mean[0], expected.mean(), rtol=1e-6)
+        np.testing.assert_allclose(std[0], expected.std(), rtol=1e-4)
+        np.testing.assert_allclose(skew[0], expected.skew(), rtol=1e-4)
+        np.testing.assert_allclose(kurt[0], expected.kurtosis(), rtol=1e-4)
+
+    def test_small_magnitude_values_keep_their_spread(self):
+        rng = np.random.default_rng(0)
+        arr = np.column_stack([rng.uniform(1e-8, 8e-8, 500), np.full(500, 0.1)])
+        expected = pd.DataFrame(arr)
+
+        kernels = _load_numpy_kernels()
+        count, mean, std, skew, kurt = kernels.column_moments(arr)
+        np.testing.assert_allclose(std[0], expected[0].std(), rtol=1e-9)
+        np.testing.assert_allclose(skew[0], expected[0].skew(), rtol=1e-9)
+        np.testing.assert_allclose(kurt[0], expected[0].kurtosis(), rtol=1e-9)
+        # A constant column still reports zero skewness and kurtosis
+        self.assertEqual(skew[1], 0.0)
+        self.assertEqual(kurt[1], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()